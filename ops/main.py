@@ -12,6 +12,9 @@ import ops.model
 
 CHARM_STATE_FILE = '.unit-state.db'
 
+# Prefer the libyaml-based loader when PyYAML was built with it.
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def debugf(format, *args, **kwargs):
     pass
@@ -29,7 +32,7 @@ def _get_charm_dir():
 
 def _load_metadata(charm_dir):
     with open(charm_dir / 'metadata.yaml') as f:
-        metadata = yaml.load(f, Loader=yaml.SafeLoader)
+        metadata = yaml.load(f, Loader=_SafeLoader)
     return metadata
 
 
@@ -1,10 +1,11 @@
 #!/usr/bin/python3
 
+import atexit
+import csv
 import os
 import tempfile
 import subprocess
 import pathlib
-import shutil
 import unittest
 import time
 import re
@@ -12,17 +13,40 @@ import re
 import ops.model
 import ops.charm
 
+_LEASE_RENEWAL_SECONDS = ops.model.ModelBackend.LEASE_RENEWAL_PERIOD.total_seconds()
+
+# 8 bytes are used as of python 3.4.0, see Python bug #12015.
+# Other characters are from POSIX 3.282 (Portable Filename Character Set) a subset of which Python's mkdtemp uses.
+_POD_SPEC_TMP_RE = re.compile(r'/tmp/tmp[A-Za-z0-9._-]{8}-pod-spec-set')
+
+_DB1_RELATION_IDS = """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'"""
+_DB1_RELATION_LIST = """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2"""
+
 
 class TestModel(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        cls._environ = os.environ.copy()
         os.environ['JUJU_UNIT_NAME'] = 'myapp/0'
-        self.addCleanup(os.environ.pop, 'JUJU_UNIT_NAME')
 
+        # The metadata is never modified by the tests so it can be shared between them.
+        cls.meta = ops.charm.CharmMeta()
+        cls.meta.relations = {'db0': None, 'db1': None, 'db2': None}
+
+    @classmethod
+    def tearDownClass(cls):
+        os.environ.clear()
+        os.environ.update(cls._environ)
+
+    def setUp(self):
         self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
+        self.model = ops.model.Model('myapp/0', self.meta, self.backend)
+
+    def _install_db1_fakes(self):
+        """Install relation-ids and relation-list fakes for a db1:4 relation with two remote units."""
+        fake_script(self, 'relation-ids', _DB1_RELATION_IDS)
+        fake_script(self, 'relation-list', _DB1_RELATION_LIST)
 
     def test_model(self):
         self.assertIs(self.model.app, self.model.unit.app)
@@ -35,7 +59,7 @@ class TestModel(unittest.TestCase):
 
         for relation in self.model.relations['db2']:
             self.assertIn(self.model.unit, relation.data)
-            unit_from_rel = next(filter(lambda u: u.name == 'myapp/0', relation.data.keys()))
+            unit_from_rel = next(u for u in relation.data.keys() if u.name == 'myapp/0')
             self.assertIs(self.model.unit, unit_from_rel)
 
         self.assertEqual(fake_script_calls(self), [
@@ -79,10 +103,7 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_remote_units_is_our(self):
-        fake_script(self, 'relation-ids',
-                    """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list',
-                    """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+        self._install_db1_fakes()
 
         for u in self.model.get_relation('db1').units:
             self.assertFalse(u._is_our_unit)
@@ -102,11 +123,12 @@ class TestModel(unittest.TestCase):
         fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0"]' || exit 2""")
         fake_script(self, 'relation-get', """([ "$2" = 4 ] && [ "$4" = "remoteapp1/0" ]) && echo '{"host": "remoteapp1-0"}' || exit 2""")
 
+        rel_db1 = self.model.get_relation('db1')
         random_unit = self.model._cache.get(ops.model.Unit, 'randomunit/0')
         with self.assertRaises(KeyError):
-            self.model.get_relation('db1').data[random_unit]
-        remoteapp1_0 = next(filter(lambda u: u.name == 'remoteapp1/0', self.model.get_relation('db1').units))
-        self.assertEqual(self.model.get_relation('db1').data[remoteapp1_0], {'host': 'remoteapp1-0'})
+            rel_db1.data[random_unit]
+        remoteapp1_0 = _unit_named(rel_db1, 'remoteapp1/0')
+        self.assertEqual(rel_db1.data[remoteapp1_0], {'host': 'remoteapp1-0'})
 
         self.assertEqual(fake_script_calls(self), [
             ['relation-ids', 'db1', '--format=json'],
@@ -115,22 +137,17 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_remote_app_relation_data(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
-        fake_script(self, 'relation-ids', """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+        self._install_db1_fakes()
         fake_script(self, 'relation-get', """[ "$2" = 4 ] && [ "$4" = remoteapp1 ] && echo '{"secret": "cafedeadbeef"}' || exit 2""")
 
         # Try to get relation data for an invalid remote application.
+        rel_db1 = self.model.get_relation('db1')
         random_app = self.model._cache.get(ops.model.Application, 'randomapp')
         with self.assertRaises(KeyError):
-            self.model.get_relation('db1').data[random_app]
+            rel_db1.data[random_app]
 
-        remoteapp1 = self.model.get_relation('db1').app
-        self.assertEqual(self.model.get_relation('db1').data[remoteapp1], {'secret': 'cafedeadbeef'})
+        remoteapp1 = rel_db1.app
+        self.assertEqual(rel_db1.data[remoteapp1], {'secret': 'cafedeadbeef'})
 
         self.assertEqual(fake_script_calls(self), [
             ['relation-ids', 'db1', '--format=json'],
@@ -144,7 +161,7 @@ class TestModel(unittest.TestCase):
         fake_script(self, 'relation-get', """([ "$2" = 4 ] && [ "$4" = "remoteapp1/0" ]) && echo '{"host": "remoteapp1-0"}' || exit 2""")
 
         rel_db1 = self.model.get_relation('db1')
-        remoteapp1_0 = next(filter(lambda u: u.name == 'remoteapp1/0', self.model.get_relation('db1').units))
+        remoteapp1_0 = _unit_named(rel_db1, 'remoteapp1/0')
         # Force memory cache to be loaded.
         self.assertIn('host', rel_db1.data[remoteapp1_0])
         with self.assertRaises(ops.model.RelationDataError):
@@ -177,13 +194,7 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_app_relation_data_modify_local_as_leader(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
-        fake_script(self, 'relation-ids', """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+        self._install_db1_fakes()
         fake_script(self, 'relation-get', """[ "$2" = 4 ] && [ "$4" = myapp ] && echo '{"password": "deadbeefcafe"}' || exit 2""")
         fake_script(self, 'relation-set', """[ "$2" = 4 ] && exit 0 || exit 2""")
         fake_script(self, 'is-leader', 'echo true')
@@ -206,13 +217,7 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_app_relation_data_modify_local_as_minion(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
-        fake_script(self, 'relation-ids', """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+        self._install_db1_fakes()
         fake_script(self, 'relation-get', """[ "$2" = 4 ] && [ "$4" = myapp ] && echo '{"password": "deadbeefcafe"}' || exit 2""")
         fake_script(self, 'is-leader', 'echo false')
 
@@ -277,8 +282,6 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_relation_get_set_is_app_arg(self):
-        self.backend = ops.model.ModelBackend()
-
         # No is_app provided.
         with self.assertRaises(TypeError):
             self.backend.relation_set(1, 'fookey', 'barval')
@@ -328,11 +331,7 @@ class TestModel(unittest.TestCase):
 
     def test_is_leader(self):
         def check_remote_units():
-            fake_script(self, 'relation-ids',
-                        """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-
-            fake_script(self, 'relation-list',
-                        """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+            self._install_db1_fakes()
 
             # Cannot determine leadership for remote units.
             for u in self.model.get_relation('db1').units:
@@ -344,15 +343,13 @@ class TestModel(unittest.TestCase):
 
         check_remote_units()
 
-        # Create a new model and backend to drop a cached is-leader output.
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
+        # Drop the cached is-leader output.
+        self.backend._leader_check_time = 0
 
         fake_script(self, 'is-leader', 'echo false')
         self.assertFalse(self.model.unit.is_leader())
 
+        # The relations are already loaded, so no more relation tool calls are made.
         check_remote_units()
 
         self.assertEqual(fake_script_calls(self), [
@@ -360,13 +357,11 @@ class TestModel(unittest.TestCase):
             ['relation-ids', 'db1', '--format=json'],
             ['relation-list', '-r', '4', '--format=json'],
             ['is-leader', '--format=json'],
-            ['relation-ids', 'db1', '--format=json'],
-            ['relation-list', '-r', '4', '--format=json'],
         ])
 
     def test_is_leader_refresh(self):
         # A sanity check.
-        self.assertGreater(time.monotonic(), ops.model.ModelBackend.LEASE_RENEWAL_PERIOD.total_seconds())
+        self.assertGreater(time.monotonic(), _LEASE_RENEWAL_SECONDS)
 
         fake_script(self, 'is-leader', 'echo false')
         self.assertFalse(self.model.unit.is_leader())
@@ -409,11 +404,9 @@ class TestModel(unittest.TestCase):
         def check_calls(calls):
             # There may 1 or 2 calls because of is-leader.
             self.assertLessEqual(len(fake_calls), 2)
-            pod_spec_call = next(filter(lambda c: c[0] == 'pod-spec-set', calls))
+            pod_spec_call = next(c for c in calls if c[0] == 'pod-spec-set')
             self.assertEqual(pod_spec_call[:2], ['pod-spec-set', '--file'])
-            # 8 bytes are used as of python 3.4.0, see Python bug #12015.
-            # Other characters are from POSIX 3.282 (Portable Filename Character Set) a subset of which Python's mkdtemp uses.
-            self.assertTrue(re.match('/tmp/tmp[A-Za-z0-9._-]{8}-pod-spec-set', pod_spec_call[2]))
+            self.assertTrue(_POD_SPEC_TMP_RE.match(pod_spec_call[2]))
 
         self.model.pod.set_spec({'foo': 'bar'})
         self.assertEqual(spec_path.read_text(), '{"foo": "bar"}')
@@ -429,10 +422,8 @@ class TestModel(unittest.TestCase):
         fake_calls = fake_script_calls(self, clear=True)
         check_calls(fake_calls)
 
-        # Create a new model to drop is-leader caching result.
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
+        # Force a recheck of the cached is-leader result.
+        self.backend._leader_check_time = 0
         fake_script(self, 'is-leader', 'echo false')
         with self.assertRaises(ops.model.ModelError):
             self.model.pod.set_spec({'foo': 'bar'})
@@ -446,79 +437,43 @@ class TestModel(unittest.TestCase):
             ops.model.ActiveStatus('test')
 
     def test_local_set_valid_unit_status(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
-        test_cases = [(
-            ops.model.ActiveStatus(),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertEqual(fake_script_calls(self, True), [['status-set', '--application=False', 'active', '']]),
-        ), (
-            ops.model.MaintenanceStatus('Yellow'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertEqual(fake_script_calls(self, True), [['status-set', '--application=False', 'maintenance', 'Yellow']]),
-        ), (
-            ops.model.BlockedStatus('Red'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertEqual(fake_script_calls(self, True), [['status-set', '--application=False', 'blocked', 'Red']]),
-        ), (
-            ops.model.WaitingStatus('White'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertEqual(fake_script_calls(self, True), [['status-set', '--application=False', 'waiting', 'White']]),
-        )]
+        fake_script(self, 'status-set', 'exit 0')
 
-        for target_status, setup_tools, check_tool_calls in test_cases:
-            setup_tools()
+        test_cases = [
+            (ops.model.ActiveStatus(), ['status-set', '--application=False', 'active', '']),
+            (ops.model.MaintenanceStatus('Yellow'), ['status-set', '--application=False', 'maintenance', 'Yellow']),
+            (ops.model.BlockedStatus('Red'), ['status-set', '--application=False', 'blocked', 'Red']),
+            (ops.model.WaitingStatus('White'), ['status-set', '--application=False', 'waiting', 'White']),
+        ]
 
-            self.model.unit.status = target_status
+        for target_status, expected_call in test_cases:
+            with self.subTest(status=target_status.name):
+                self.model.unit.status = target_status
 
-            self.assertEqual(self.model.unit.status, target_status)
+                self.assertEqual(self.model.unit.status, target_status)
 
-            check_tool_calls()
+                self.assertEqual(fake_script_calls(self, True), [expected_call])
 
     def test_local_set_valid_app_status(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
         fake_script(self, 'is-leader', 'echo true')
+        fake_script(self, 'status-set', 'exit 0')
 
-        test_cases = [(
-            ops.model.ActiveStatus(),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertIn(['status-set', '--application=True', 'active', ''], fake_script_calls(self, True)),
-        ), (
-            ops.model.MaintenanceStatus('Yellow'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertIn(['status-set', '--application=True', 'maintenance', 'Yellow'], fake_script_calls(self, True)),
-        ), (
-            ops.model.BlockedStatus('Red'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertIn(['status-set', '--application=True', 'blocked', 'Red'], fake_script_calls(self, True)),
-        ), (
-            ops.model.WaitingStatus('White'),
-            lambda: fake_script(self, 'status-set', 'exit 0'),
-            lambda: self.assertIn(['status-set', '--application=True', 'waiting', 'White'], fake_script_calls(self, True)),
-        )]
-
-        for target_status, setup_tools, check_tool_calls in test_cases:
-            setup_tools()
+        test_cases = [
+            (ops.model.ActiveStatus(), ['status-set', '--application=True', 'active', '']),
+            (ops.model.MaintenanceStatus('Yellow'), ['status-set', '--application=True', 'maintenance', 'Yellow']),
+            (ops.model.BlockedStatus('Red'), ['status-set', '--application=True', 'blocked', 'Red']),
+            (ops.model.WaitingStatus('White'), ['status-set', '--application=True', 'waiting', 'White']),
+        ]
 
-            self.model.app.status = target_status
+        for target_status, expected_call in test_cases:
+            with self.subTest(status=target_status.name):
+                self.model.app.status = target_status
 
-            self.assertEqual(self.model.app.status, target_status)
+                self.assertEqual(self.model.app.status, target_status)
 
-            check_tool_calls()
+                self.assertIn(expected_call, fake_script_calls(self, True))
 
     def test_set_app_status_non_leader_raises(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
         fake_script(self, 'is-leader', 'echo false')
 
         with self.assertRaises(RuntimeError):
@@ -528,11 +483,6 @@ class TestModel(unittest.TestCase):
             self.model.app.status = ops.model.ActiveStatus()
 
     def test_local_set_invalid_status(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
-
         fake_script(self, 'status-set', 'exit 1')
         fake_script(self, 'is-leader', 'echo true')
 
@@ -553,22 +503,14 @@ class TestModel(unittest.TestCase):
         ])
 
     def test_status_set_is_app_not_bool_raises(self):
-        self.backend = ops.model.ModelBackend()
-
         for is_app_v in [None, 1, 2.0, 'a', b'beef', object]:
             with self.assertRaises(TypeError):
                 self.backend.status_set(ops.model.ActiveStatus, is_app=is_app_v)
 
     def test_remote_unit_status(self):
-        self.backend = ops.model.ModelBackend()
-        meta = ops.charm.CharmMeta()
-        meta.relations = {'db0': None, 'db1': None, 'db2': None}
-        self.model = ops.model.Model('myapp/0', meta, self.backend)
+        self._install_db1_fakes()
 
-        fake_script(self, 'relation-ids', """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
-
-        remote_unit = next(filter(lambda u: u.name == 'remoteapp1/0', self.model.get_relation('db1').units))
+        remote_unit = _unit_named(self.model.get_relation('db1'), 'remoteapp1/0')
 
         test_statuses = (
             ops.model.UnknownStatus(),
@@ -579,12 +521,12 @@ class TestModel(unittest.TestCase):
         )
 
         for target_status in test_statuses:
-            with self.assertRaises(RuntimeError):
-                remote_unit.status = target_status
+            with self.subTest(status=target_status.name):
+                with self.assertRaises(RuntimeError):
+                    remote_unit.status = target_status
 
     def test_remote_app_status(self):
-        fake_script(self, 'relation-ids', """[ "$1" = db1 ] && echo '["db1:4"]' || echo '[]'""")
-        fake_script(self, 'relation-list', """[ "$2" = 4 ] && echo '["remoteapp1/0", "remoteapp1/1"]' || exit 2""")
+        self._install_db1_fakes()
 
         remoteapp1 = self.model.get_relation('db1').app
 
@@ -599,8 +541,9 @@ class TestModel(unittest.TestCase):
             ops.model.WaitingStatus('Awaiting related app updates'),
         )
         for target_status in test_statuses:
-            with self.assertRaises(RuntimeError):
-                remoteapp1.status = target_status
+            with self.subTest(status=target_status.name):
+                with self.assertRaises(RuntimeError):
+                    remoteapp1.status = target_status
 
         self.assertEqual(fake_script_calls(self, clear=True), [
             ['relation-ids', 'db1', '--format=json'],
@@ -663,52 +606,61 @@ class TestModel(unittest.TestCase):
 
 class TestModelBackend(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        cls._environ = os.environ.copy()
         os.environ['JUJU_UNIT_NAME'] = 'myapp/0'
-        self.addCleanup(os.environ.pop, 'JUJU_UNIT_NAME')
 
+    @classmethod
+    def tearDownClass(cls):
+        os.environ.clear()
+        os.environ.update(cls._environ)
+
+    def setUp(self):
         self.backend = ops.model.ModelBackend()
 
     def test_relation_tool_errors(self):
         err_msg = "ERROR invalid value \"$2\" for option -r: relation not found"
 
+        # Each tool fails with a generic error for relation 3 and reports relation 4 as not found.
+        for tool in ('relation-list', 'relation-set', 'relation-get'):
+            fake_script(self, tool, f'[ "$2" = 4 ] && {{ echo {err_msg} >&2 ; exit 2 ; }} ; echo fooerror >&2 ; exit 1')
+
         test_cases = [(
-            lambda: fake_script(self, 'relation-list', f'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.relation_list(3),
             ops.model.ModelError,
             [['relation-list', '-r', '3', '--format=json']],
         ), (
-            lambda: fake_script(self, 'relation-list', f'echo {err_msg} >&2 ; exit 2'),
-            lambda: self.backend.relation_list(3),
+            lambda: self.backend.relation_list(4),
             ops.model.RelationNotFoundError,
-            [['relation-list', '-r', '3', '--format=json']],
+            [['relation-list', '-r', '4', '--format=json']],
         ), (
-            lambda: fake_script(self, 'relation-set', f'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.relation_set(3, 'foo', 'bar', is_app=False),
             ops.model.ModelError,
             [['relation-set', '-r', '3', 'foo=bar', '--app=False']],
         ), (
-            lambda: fake_script(self, 'relation-set', f'echo {err_msg} >&2 ; exit 2'),
-            lambda: self.backend.relation_set(3, 'foo', 'bar', is_app=False),
+            lambda: self.backend.relation_set(4, 'foo', 'bar', is_app=False),
             ops.model.RelationNotFoundError,
-            [['relation-set', '-r', '3', 'foo=bar', '--app=False']],
+            [['relation-set', '-r', '4', 'foo=bar', '--app=False']],
         ), (
-            lambda: fake_script(self, 'relation-get', f'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.relation_get(3, 'remote/0', is_app=False),
             ops.model.ModelError,
             [['relation-get', '-r', '3', '-', 'remote/0', '--app=False', '--format=json']],
         ), (
-            lambda: fake_script(self, 'relation-get', f'echo {err_msg} >&2 ; exit 2'),
-            lambda: self.backend.relation_get(3, 'remote/0', is_app=False),
+            lambda: self.backend.relation_get(4, 'remote/0', is_app=False),
             ops.model.RelationNotFoundError,
-            [['relation-get', '-r', '3', '-', 'remote/0', '--app=False', '--format=json']],
+            [['relation-get', '-r', '4', '-', 'remote/0', '--app=False', '--format=json']],
         )]
 
-        for do_fake, run, exception, calls in test_cases:
-            do_fake()
-            with self.assertRaises(exception):
-                run()
-            self.assertEqual(fake_script_calls(self, clear=True), calls)
+        for run, exception, calls in test_cases:
+            with self.subTest(call=calls[0]):
+                # Always clear the recorded calls so that a failing case does not affect the next ones.
+                try:
+                    with self.assertRaises(exception):
+                        run()
+                finally:
+                    actual_calls = fake_script_calls(self, clear=True)
+                self.assertEqual(actual_calls, calls)
 
     def test_status_is_app_forced_kwargs(self):
         fake_script(self, 'status-get', 'exit 1')
@@ -727,27 +679,27 @@ class TestModelBackend(unittest.TestCase):
 
     def test_storage_tool_errors(self):
         test_cases = [(
-            lambda: fake_script(self, 'storage-list', f'echo fooerror >&2 ; exit 1'),
+            lambda: fake_script(self, 'storage-list', 'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.storage_list('foobar'),
             ops.model.ModelError,
             [['storage-list', 'foobar', '--format=json']],
         ), (
-            lambda: fake_script(self, 'storage-get', f'echo fooerror >&2 ; exit 1'),
+            lambda: fake_script(self, 'storage-get', 'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.storage_get('foobar', 'someattr'),
             ops.model.ModelError,
             [['storage-get', '-s', 'foobar', 'someattr', '--format=json']],
         ), (
-            lambda: fake_script(self, 'storage-add', f'echo fooerror >&2 ; exit 1'),
+            lambda: fake_script(self, 'storage-add', 'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.storage_add('foobar', count=2),
             ops.model.ModelError,
             [['storage-add', 'foobar=2']],
         ), (
-            lambda: fake_script(self, 'storage-add', f'echo fooerror >&2 ; exit 1'),
+            lambda: fake_script(self, 'storage-add', 'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.storage_add('foobar', count=object),
             TypeError,
             [],
         ), (
-            lambda: fake_script(self, 'storage-add', f'echo fooerror >&2 ; exit 1'),
+            lambda: fake_script(self, 'storage-add', 'echo fooerror >&2 ; exit 1'),
             lambda: self.backend.storage_add('foobar', count=True),
             TypeError,
             [],
@@ -759,30 +711,80 @@ class TestModelBackend(unittest.TestCase):
             self.assertEqual(fake_script_calls(self, clear=True), calls)
 
 
+def _unit_named(relation, name):
+    """Return the remote unit of a relation with the given name."""
+    return next(u for u in relation.units if u.name == name)
+
+
+# Before executing the provided script, dump the provided arguments in calls.txt.
+# Only shell builtins and parameter expansion are used so that recording a call does not fork,
+# and the file is opened once on fd 3 rather than once per redirection.
+_FAKE_SCRIPT_PROLOGUE = (
+    b'#!/bin/bash\n'
+    b'exec 3>>"${0%/*}/calls.txt"\n'
+    b'{ printf %s "${0##*/}"; for s in "$@"; do printf \';%s\' "$s"; done; printf \'\\n\'; } >&3\n'
+    b'exec 3>&-\n'
+)
+
+_fake_script_dir = None
+
+
+def _get_fake_script_dir():
+    """Return a fake script directory shared by all tests, creating it on first use."""
+    global _fake_script_dir
+    if _fake_script_dir is None:
+        _fake_script_dir = pathlib.Path(tempfile.mkdtemp('-fake_script'))
+        atexit.register(_remove_fake_script_dir, _fake_script_dir)
+    return _fake_script_dir
+
+
+def _clear_fake_script_dir(fake_script_path):
+    # The directory is flat, so there is no need for shutil.rmtree to walk and stat it.
+    for entry in os.scandir(fake_script_path):
+        os.unlink(entry.path)
+
+
+def _remove_fake_script_dir(fake_script_path):
+    _clear_fake_script_dir(fake_script_path)
+    os.rmdir(fake_script_path)
+
+
 def fake_script(test_case, name, content):
     if not hasattr(test_case, 'fake_script_path'):
-        fake_script_path = tempfile.mkdtemp('-fake_script')
-        os.environ['PATH'] = f'{fake_script_path}:{os.environ["PATH"]}'
+        fake_script_path = _get_fake_script_dir()
+        orig_path = os.environ['PATH']
+        os.environ['PATH'] = f'{fake_script_path}:{orig_path}'
 
         def cleanup():
-            shutil.rmtree(fake_script_path)
-            os.environ['PATH'] = os.environ['PATH'].replace(fake_script_path + ':', '')
+            os.environ['PATH'] = orig_path
+            # Leave the directory itself in place for the next test to reuse.
+            _clear_fake_script_dir(fake_script_path)
 
         test_case.addCleanup(cleanup)
-        test_case.fake_script_path = pathlib.Path(fake_script_path)
+        test_case.fake_script_path = fake_script_path
+        test_case._fake_script_contents = {}
+
+    if test_case._fake_script_contents.get(name) == content:
+        # The script is already installed as requested.
+        return
+    test_case._fake_script_contents[name] = content
 
-    with open(test_case.fake_script_path / name, "w") as f:
-        # Before executing the provided script, dump the provided arguments in calls.txt.
-        f.write('#!/bin/bash\n{ echo -n $(basename $0); for s in "$@"; do echo -n \\;$s; done; echo; } >> $(dirname $0)/calls.txt\n' + content)
-    os.chmod(test_case.fake_script_path / name, 0o755)
+    fd = os.open(test_case.fake_script_path / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # The mode given to os.open is subject to the umask, so set it explicitly.
+        os.fchmod(fd, 0o755)
+        os.write(fd, _FAKE_SCRIPT_PROLOGUE + content.encode())
+    finally:
+        os.close(fd)
 
 
 def fake_script_calls(test_case, clear=False):
-    with open(test_case.fake_script_path / 'calls.txt', 'r+') as f:
-        calls = [line.split(';') for line in f.read().splitlines()]
+    with open(test_case.fake_script_path / 'calls.txt', 'r+', newline='') as f:
+        # Arguments are recorded verbatim, so quote characters must not be interpreted.
+        calls = list(csv.reader(f, delimiter=';', quoting=csv.QUOTE_NONE))
         if clear:
             f.truncate(0)
-        return calls
+    return calls
 
 
 class FakeScriptTest(unittest.TestCase):